@@ -4,9 +4,10 @@ Initializes the Flask application with all modules.
 
 import os
 from flask import Flask
-from flasgger import Swagger
 from dotenv import load_dotenv
 from app.utils.rate.rate_limiter import setup_rate_limiter
+from config.json_provider import OrjsonProvider
+from config.swagger_cache import CachedSwagger
 from config.log_config import (
     configure_logging, log_request_info, log_response_info
 )
@@ -16,6 +17,7 @@ load_dotenv()
 
 app = Flask(__name__)
 app.secret_key = os.getenv("SECRET_KEY")  # Load SECRET_KEY from .env
+app.json = OrjsonProvider(app)  # Serialize JSON responses with orjson
 
 # Swagger Configuration
 app.config['SWAGGER'] = {
@@ -30,7 +32,19 @@ app.config['SWAGGER'] = {
     ),
     'version': '1.0.0'
 }
-swagger = Swagger(app)
+
+# Serve a precompiled OpenAPI spec when one has been built with
+# tools/build_openapi.py; otherwise the docstrings are parsed once on
+# the first spec request and memoized
+_OPENAPI_SPEC_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "static", "openapi.json"
+)
+swagger = CachedSwagger(
+    app,
+    spec_file=(
+        _OPENAPI_SPEC_FILE if os.path.exists(_OPENAPI_SPEC_FILE) else None
+    )
+)
 
 # Rate Limiter
 limiter = setup_rate_limiter(app)
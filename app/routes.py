@@ -5,20 +5,20 @@ Defines API endpoints for AI-Powered Job Application Assistant.
 # ======================
 # Standard Library Imports
 # ======================
+import hashlib
 import os
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 # ======================
 # Third-party Imports
 # ======================
-from flask import request, jsonify, send_file
+from flask import request, jsonify, send_file, Response, stream_with_context
 from dotenv import load_dotenv
 
 # ======================
 # Application & Configuration Imports
 # ======================
 from app import app, limiter
-from config.log_config import configure_logging, log_request_info, log_response_info
 
 # ======================
 # Language Support Imports
@@ -30,9 +30,12 @@ from language.supported_languages import SUPPORTED_LANGUAGES, get_language_name
 # ======================
 from app.utils.document.cover_letter_generator import (
     generate_cover_letter,
-    generate_cover_letter_with_cv
+    generate_cover_letter_with_cv,
+    stream_cover_letter,
+    stream_cover_letter_with_cv
 )
-from app.utils.document.document_extraction import extract_text
+from app.utils.document.document_extraction import extract_text_cached
+from app.utils.cache.singleflight import single_flight
 
 # ======================
 # Authentication & Rate Limiting Imports
@@ -45,7 +48,6 @@ from app.utils.rate.rate_limiter import RATE_LIMIT
 # ======================
 from app.utils.file.file_management import (
     ensure_directory_exists,
-    save_temporary_file,
     get_format_function
 )
 
@@ -53,13 +55,13 @@ from app.utils.file.file_management import (
 # Evaluation & Interview Preparation Imports
 # ======================
 from app.utils.evaluation.cv_matcher import evaluate_cv_with_openai, compute_similarity_score
+from app.utils.evaluation.full_report import (
+    generate_bundle,
+    stream_evaluation,
+    stream_interview_questions
+)
 from app.utils.evaluation.interview_preparation import generate_interview_questions
 
-# Configure logging
-configure_logging(app)
-log_request_info(app)
-log_response_info(app)
-
 # Load environment variables
 load_dotenv()
 TEMP_DIR = os.getenv("TEMP_DIR")
@@ -67,6 +69,35 @@ TEMP_DIR = os.getenv("TEMP_DIR")
 # Ensure the temporary directory exists
 ensure_directory_exists(TEMP_DIR)
 
+# Precomputed language validation artifacts shared by every endpoint, so
+# the per-request check is one frozenset membership test and failures
+# reuse one prebuilt JSON body
+_LANG_SET = frozenset(SUPPORTED_LANGUAGES)
+_LANG_ERROR_BODY = (
+    '{"error": "Unsupported language. Choose from '
+    + str(list(SUPPORTED_LANGUAGES)) + '."}'
+)
+
+# Shared executor for running independent I/O-bound subtasks concurrently
+EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Dedicated pool for PDF/DOCX/TXT rendering so document formatting runs
+# outside the request thread and concurrent renders are bounded
+RENDER_POOL = ThreadPoolExecutor(max_workers=4)
+
+
+def _text_hash(text):
+    """
+    Returns a short stable digest of a text, used to build coalescing keys.
+
+    Args:
+        text (str): The text to hash.
+
+    Returns:
+        str: Hex digest of the text content.
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
 
 @app.route("/health", methods=["GET"])
 def health_check():
@@ -143,6 +174,11 @@ def generate_cover_letter_endpoint():
                            "generated."
               enum: ["en", "tr", "de", "fr", "es", "it", "nl"]
               example: "en"
+            quality:
+              type: string
+              description: "Optional quality tier controlling the model used."
+              enum: ["fast", "balanced", "best"]
+              example: "fast"
     responses:
       '200':
         description: "Cover letter generated successfully and ready for download."
@@ -210,6 +246,7 @@ def generate_cover_letter_endpoint():
         job_description = data.get("job_description")
         file_format = data.get("file_format", "").lower()
         language = data.get("language", "en").lower()
+        quality = data.get("quality", "").lower() or None
 
         # Validate job description
         if not job_description or not job_description.strip():
@@ -227,22 +264,41 @@ def generate_cover_letter_endpoint():
             ), 400
 
         # Validate language
-        language_name = get_language_name(language)
-        if not language_name:
+        if language not in _LANG_SET:
             app.logger.warning(
                 f"Unsupported language requested: {language}"
             )
-            return jsonify(
-                {"error": f"Unsupported language. Choose from "
-                          f"{list(SUPPORTED_LANGUAGES.keys())}."}
-            ), 400
+            return Response(
+                _LANG_ERROR_BODY, 400, mimetype="application/json"
+            )
+        language_name = get_language_name(language)
+
+        # Stream plain text letters directly to the client, overlapping
+        # generation with transfer instead of buffering the full response
+        if file_format == "txt":
+            app.logger.info("Streaming cover letter as plain text.")
+            return Response(
+                stream_with_context(
+                    stream_cover_letter(
+                        job_description, language_name, quality
+                    )
+                ),
+                mimetype="text/plain",
+                headers={
+                    "Content-Disposition":
+                        "attachment; filename=cover_letter.txt"
+                }
+            )
 
-        # Generate cover letter
+        # Generate cover letter; identical concurrent requests share one call
         app.logger.info("Generating cover letter with OpenAI API.")
-        cover_letter = generate_cover_letter(job_description, language_name)
+        cover_letter = single_flight.execute(
+            ("cover_letter", _text_hash(job_description), language, quality),
+            generate_cover_letter, job_description, language_name, quality
+        )
 
-        # Save cover letter to specified format
-        file_path = format_function(cover_letter)
+        # Render the cover letter on the shared render pool
+        file_path = RENDER_POOL.submit(format_function, cover_letter).result()
 
         # Convert to absolute path for serving the file
         absolute_path = os.path.abspath(file_path)
@@ -302,6 +358,12 @@ def generate_cover_letter_with_cv_endpoint():
           generated.
         type: string
         enum: ["en", "tr", "de", "fr", "es", "it", "nl"]
+      - in: formData
+        name: quality
+        required: false
+        description: Optional quality tier controlling the model used.
+        type: string
+        enum: ["fast", "balanced", "best"]
     responses:
       '200':
         description: File download starts automatically.
@@ -351,6 +413,7 @@ def generate_cover_letter_with_cv_endpoint():
         job_description = request.form.get("job_description")
         file_format = request.form.get("file_format", "").lower()
         language = request.form.get("language", "en").lower()
+        quality = request.form.get("quality", "").lower() or None
         cv_file = request.files.get("cv_file")
 
         if not cv_file or not job_description:
@@ -358,48 +421,65 @@ def generate_cover_letter_with_cv_endpoint():
             return jsonify({"error": "CV file and job description are required."}
                            ), 400
 
-        # Ensure the temp folder exists
-        ensure_directory_exists(TEMP_DIR)
-
-        # Process file within a temporary directory
-        with tempfile.TemporaryDirectory(dir=TEMP_DIR) as temp_dir:
-            temp_file_path = save_temporary_file(cv_file, temp_dir)
-            cv_text = extract_text(temp_file_path)
-            app.logger.info("CV text extracted successfully.")
-
-            # Validate language input
-            language_name = get_language_name(language)
-            if not language_name:
-                app.logger.error(f"Unsupported language: {language}")
-                return jsonify(
-                    {"error": ("Unsupported language. Choose from " +
-                               "['en', 'tr', 'de', 'fr', 'es', 'it', 'nl'].")}
-                ), 400
-
-            # Generate cover letter using OpenAI
-            app.logger.info(
-                "Generating cover letter using OpenAI with job description and CV text."
-            )
-            cover_letter = generate_cover_letter_with_cv(
-                job_description, cv_text, language_name
+        # Extract the CV text entirely in memory; no temp file is written
+        cv_bytes = cv_file.read()
+        cv_hash = hashlib.blake2b(cv_bytes, digest_size=16).hexdigest()
+        cv_text = extract_text_cached(cv_hash, cv_bytes, cv_file.filename)
+        app.logger.info("CV text extracted successfully.")
+
+        # Validate language input
+        if language not in _LANG_SET:
+            app.logger.error(f"Unsupported language: {language}")
+            return Response(
+                _LANG_ERROR_BODY, 400, mimetype="application/json"
             )
+        language_name = get_language_name(language)
 
-            # Format and save cover letter in requested file format
-            format_function = get_format_function(file_format)
-            if not format_function:
-                app.logger.error(f"Invalid file format: {file_format}")
-                return jsonify(
-                    {"error": ("Invalid file format. Choose from 'pdf', "
-                               "'docx', 'txt'.")}
-                ), 400
-
-            file_path = format_function(cover_letter)
-            absolute_path = os.path.abspath(file_path)
-            app.logger.info(
-                f"Cover letter successfully generated and saved at {absolute_path}"
+        # Validate file format before generating
+        format_function = get_format_function(file_format)
+        if not format_function:
+            app.logger.error(f"Invalid file format: {file_format}")
+            return jsonify(
+                {"error": ("Invalid file format. Choose from 'pdf', "
+                           "'docx', 'txt'.")}
+            ), 400
+
+        # Stream plain text letters directly to the client
+        if file_format == "txt":
+            app.logger.info("Streaming cover letter as plain text.")
+            return Response(
+                stream_with_context(
+                    stream_cover_letter_with_cv(
+                        job_description, cv_text, language_name, quality
+                    )
+                ),
+                mimetype="text/plain",
+                headers={
+                    "Content-Disposition":
+                        "attachment; filename=cover_letter.txt"
+                }
             )
 
-            return send_file(absolute_path, as_attachment=True)
+        # Generate cover letter using OpenAI
+        app.logger.info(
+            "Generating cover letter using OpenAI with job description and CV text."
+        )
+        cover_letter = single_flight.execute(
+            ("cover_letter_cv", _text_hash(job_description), cv_hash,
+             language, quality),
+            generate_cover_letter_with_cv, job_description, cv_text,
+            language_name, quality
+        )
+
+        file_path = RENDER_POOL.submit(
+            format_function, cover_letter
+        ).result()
+        absolute_path = os.path.abspath(file_path)
+        app.logger.info(
+            f"Cover letter successfully generated and saved at {absolute_path}"
+        )
+
+        return send_file(absolute_path, as_attachment=True)
 
     except Exception as e:
         app.logger.error(
@@ -444,6 +524,13 @@ def evaluate_cv_match_endpoint():
         description: The language for the evaluation report.
         type: string
         enum: ["en", "tr", "de", "fr", "es", "it", "nl"]
+      - in: formData
+        name: stream
+        required: false
+        description: When 'true', streams the evaluation as plain text
+          instead of returning JSON with the similarity score.
+        type: string
+        enum: ["true", "false"]
     responses:
       '200':
         description: Evaluation and similarity score successfully generated.
@@ -499,6 +586,7 @@ def evaluate_cv_match_endpoint():
 
         job_description = request.form.get("job_description")
         language = request.form.get("language", "en").lower()
+        stream = request.form.get("stream", "false").lower() == "true"
         cv_file = request.files.get("cv_file")
 
         if not cv_file or not job_description:
@@ -507,40 +595,53 @@ def evaluate_cv_match_endpoint():
                 {"error": "CV file and job description are required."}
             ), 400
 
-        # Ensure the temp folder exists
-        ensure_directory_exists(TEMP_DIR)
-
-        # Process the file within a temporary directory
-        with tempfile.TemporaryDirectory(dir=TEMP_DIR) as temp_dir:
-            temp_file_path = save_temporary_file(cv_file, temp_dir)
-            cv_text = extract_text(temp_file_path)
-            app.logger.info("CV text extracted successfully.")
-
-            # Compute similarity score
-            similarity_score = compute_similarity_score(
-                job_description, cv_text, language
+        # Extract the CV text entirely in memory; no temp file is written
+        cv_bytes = cv_file.read()
+        cv_hash = hashlib.blake2b(cv_bytes, digest_size=16).hexdigest()
+        cv_text = extract_text_cached(cv_hash, cv_bytes, cv_file.filename)
+        app.logger.info("CV text extracted successfully.")
+
+        # Validate language input
+        if language not in _LANG_SET:
+            app.logger.error(f"Unsupported language: {language}")
+            return Response(
+                _LANG_ERROR_BODY, 400, mimetype="application/json"
             )
+        language_name = get_language_name(language)
 
-            # Validate language input
-            language = get_language_name(language)
-            if not language:
-                app.logger.error(f"Unsupported language: {language}")
-                return jsonify({
-                    "error": ("Unsupported language. Choose from " +
-                              "['en', 'tr', 'de', 'fr', 'es', 'it', 'nl'].")
-                }), 400
-
-            # Generate AI evaluation
-            evaluation = evaluate_cv_with_openai(
-                job_description, cv_text, language
+        # Stream the evaluation as plain text so the first tokens reach
+        # the client while the rest is still generating
+        if stream:
+            app.logger.info("Streaming CV evaluation as plain text.")
+            return Response(
+                stream_with_context(
+                    stream_evaluation(
+                        job_description, cv_text, language_name
+                    )
+                ),
+                mimetype="text/plain"
             )
 
-            response = {
-                "similarity_score": round(similarity_score, 2),
-                "evaluation": evaluation
-            }
+        # Run the similarity computation and the OpenAI evaluation
+        # concurrently; both are independent and I/O-bound
+        similarity_future = EXECUTOR.submit(
+            compute_similarity_score, job_description, cv_text, language
+        )
+        evaluation_future = EXECUTOR.submit(
+            single_flight.execute,
+            ("evaluate", _text_hash(job_description), cv_hash, language),
+            evaluate_cv_with_openai, job_description, cv_text,
+            language_name
+        )
+        similarity_score = similarity_future.result()
+        evaluation = evaluation_future.result()
 
-            return jsonify(response), 200
+        response = {
+            "similarity_score": round(similarity_score, 2),
+            "evaluation": evaluation
+        }
+
+        return jsonify(response), 200
 
     except Exception as e:
         app.logger.error(
@@ -586,6 +687,13 @@ def generate_interview_questions_endpoint():
         description: The language for the interview preparation.
         type: string
         enum: ["en", "tr", "de", "fr", "es", "it", "nl"]
+      - in: formData
+        name: stream
+        required: false
+        description: When 'true', streams the questions and answers as
+          plain text instead of returning JSON.
+        type: string
+        enum: ["true", "false"]
     responses:
       '200':
         description: Interview questions and sample answers successfully
@@ -643,6 +751,148 @@ def generate_interview_questions_endpoint():
     try:
         app.logger.info("Processing interview question generation request.")
 
+        job_description = request.form.get("job_description")
+        language = request.form.get("language", "en").lower()
+        stream = request.form.get("stream", "false").lower() == "true"
+        cv_file = request.files.get("cv_file")
+
+        if not cv_file or not job_description:
+            app.logger.warning("Missing CV file or job description.")
+            return jsonify(
+                {"error": "CV file and job description are required."}
+            ), 400
+
+        # Extract the CV text entirely in memory; no temp file is written
+        cv_bytes = cv_file.read()
+        cv_hash = hashlib.blake2b(cv_bytes, digest_size=16).hexdigest()
+        cv_text = extract_text_cached(cv_hash, cv_bytes, cv_file.filename)
+        app.logger.info("CV text extracted successfully.")
+
+        # Validate language input
+        if language not in _LANG_SET:
+            app.logger.error(f"Unsupported language: {language}")
+            return Response(
+                _LANG_ERROR_BODY, 400, mimetype="application/json"
+            )
+        language_name = get_language_name(language)
+
+        # Stream the Q&A as plain text so the first tokens reach the
+        # client while the rest is still generating
+        if stream:
+            app.logger.info("Streaming interview questions as plain text.")
+            return Response(
+                stream_with_context(
+                    stream_interview_questions(
+                        job_description, cv_text, language_name
+                    )
+                ),
+                mimetype="text/plain"
+            )
+
+        # Generate interview questions & answers using OpenAI
+        interview_qa = single_flight.execute(
+            ("interview", _text_hash(job_description), cv_hash, language),
+            generate_interview_questions, job_description, cv_text,
+            language_name
+        )
+
+        response = {"interview_qa": interview_qa}
+
+        return jsonify(response), 200
+
+    except Exception as e:
+        app.logger.error(
+            f"Internal Server Error: {str(e)}", exc_info=True
+        )
+        return jsonify({"error": "Internal server error."}), 500
+
+@app.route('/cv_full_analysis', methods=['POST'])
+@api_key_required
+@limiter.limit(RATE_LIMIT)
+def cv_full_analysis_endpoint():
+    """
+    CLG-006 (Full CV Analysis)
+    Generates a cover letter, CV evaluation, interview questions, and
+    similarity score for a CV and job description in a single request.
+
+    -------
+    tags:
+      - CV Matching
+    consumes:
+      - multipart/form-data
+    parameters:
+      - in: header
+        name: X-API-KEY
+        required: true
+        description: API Key required for authentication.
+        schema:
+          type: string
+      - in: formData
+        name: cv_file
+        required: true
+        description: The user's CV file in `pdf`, `docx`, or `txt` format.
+        type: file
+      - in: formData
+        name: job_description
+        required: true
+        description: The job description text used for the analysis.
+        type: string
+      - in: formData
+        name: language
+        required: true
+        description: The language for the generated artifacts.
+        type: string
+        enum: ["en", "tr", "de", "fr", "es", "it", "nl"]
+    responses:
+      '200':
+        description: Full analysis successfully generated.
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                similarity_score:
+                  type: number
+                  format: float
+                  example: 0.85
+                cover_letter:
+                  type: string
+                  example: "Dear Hiring Manager, ..."
+                evaluation:
+                  type: string
+                  example: ("The candidate's experience closely matches the "
+                            "job requirements.")
+                interview_qa:
+                  type: string
+                  example: |
+                    Q1: Can you describe your experience in AI model
+                        development?
+                    A1: Certainly! In my previous role at XYZ Corp, I
+                        developed...
+      '400':
+        description: Bad Request. Missing CV file or job description.
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                error:
+                  type: string
+                  example: "CV file and job description are required."
+      '500':
+        description: Internal server error.
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                error:
+                  type: string
+                  example: "Internal server error."
+    """
+    try:
+        app.logger.info("Processing full CV analysis request.")
+
         job_description = request.form.get("job_description")
         language = request.form.get("language", "en").lower()
         cv_file = request.files.get("cv_file")
@@ -653,32 +903,41 @@ def generate_interview_questions_endpoint():
                 {"error": "CV file and job description are required."}
             ), 400
 
-        # Ensure the temp folder exists
-        ensure_directory_exists(TEMP_DIR)
-
-        # Process the file within a temporary directory
-        with tempfile.TemporaryDirectory(dir=TEMP_DIR) as temp_dir:
-            temp_file_path = save_temporary_file(cv_file, temp_dir)
-            cv_text = extract_text(temp_file_path)
-            app.logger.info("CV text extracted successfully.")
-
-            # Validate language input
-            language = get_language_name(language)
-            if not language:
-                app.logger.error(f"Unsupported language: {language}")
-                return jsonify(
-                    {"error": ("Unsupported language. Choose from " +
-                               "['en', 'tr', 'de', 'fr', 'es', 'it', 'nl'].")}
-                ), 400
-
-            # Generate interview questions & answers using OpenAI
-            interview_qa = generate_interview_questions(
-                job_description, cv_text, language
+        # Extract the CV text entirely in memory; no temp file is written
+        cv_bytes = cv_file.read()
+        cv_hash = hashlib.blake2b(cv_bytes, digest_size=16).hexdigest()
+        cv_text = extract_text_cached(cv_hash, cv_bytes, cv_file.filename)
+        app.logger.info("CV text extracted successfully.")
+
+        # Validate language input
+        if language not in _LANG_SET:
+            app.logger.error(f"Unsupported language: {language}")
+            return Response(
+                _LANG_ERROR_BODY, 400, mimetype="application/json"
             )
+        language_name = get_language_name(language)
+
+        # Run the similarity computation and the bundled OpenAI call
+        # concurrently; the bundle returns all text artifacts at once
+        similarity_future = EXECUTOR.submit(
+            compute_similarity_score, job_description, cv_text, language
+        )
+        bundle_future = EXECUTOR.submit(
+            single_flight.execute,
+            ("bundle", _text_hash(job_description), cv_hash, language),
+            generate_bundle, job_description, cv_text, language_name
+        )
+        similarity_score = similarity_future.result()
+        bundle = bundle_future.result()
 
-            response = {"interview_qa": interview_qa}
+        response = {
+            "similarity_score": round(similarity_score, 2),
+            "cover_letter": bundle.get("cover_letter"),
+            "evaluation": bundle.get("evaluation"),
+            "interview_qa": bundle.get("interview_qa")
+        }
 
-            return jsonify(response), 200
+        return jsonify(response), 200
 
     except Exception as e:
         app.logger.error(
@@ -2,14 +2,24 @@
 Handles API Key authentication for API security.
 """
 
+import hmac
 import os
-from flask import request, jsonify
+from flask import request, Response
 from functools import wraps
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
-API_KEY = os.getenv("API_KEY")
+
+# Precomputed at import so the per-request path does no env lookup or
+# re-encoding of the expected key
+_API_KEY_BYTES = (os.getenv("API_KEY") or "").encode("utf-8")
+
+# Prebuilt JSON bodies for the failure paths, avoiding a jsonify call per
+# rejected request
+_MISSING_KEY_BODY = '{"error": "Missing API Key"}'
+_INVALID_KEY_BODY = '{"error": "Invalid API Key"}'
+
 
 def api_key_required(f):
     """
@@ -25,13 +35,18 @@ def api_key_required(f):
     """
     @wraps(f)
     def decorated(*args, **kwargs):
-        api_key = request.headers.get("X-API-KEY")
+        api_key = request.headers.get("X-API-KEY", "")
 
         if not api_key:
-            return jsonify({"error": "Missing API Key"}), 401
-
-        if api_key != API_KEY:
-            return jsonify({"error": "Invalid API Key"}), 401
+            return Response(
+                _MISSING_KEY_BODY, 401, mimetype="application/json"
+            )
+
+        # Constant-time comparison closes the timing side-channel of !=
+        if not hmac.compare_digest(api_key.encode("utf-8"), _API_KEY_BYTES):
+            return Response(
+                _INVALID_KEY_BODY, 401, mimetype="application/json"
+            )
 
         return f(*args, **kwargs)
 
@@ -0,0 +1,88 @@
+"""
+Coalesces embedding requests arriving from concurrent HTTP requests into
+shared batched forward passes. Single-text model calls waste most of the
+per-invocation setup cost; collecting texts queued within a short window
+and embedding them together scales throughput with concurrency.
+"""
+
+import queue
+import time
+import threading
+from concurrent.futures import Future
+
+# Maximum number of texts embedded together in one forward pass.
+BATCH_SIZE = 32
+
+# Maximum time (milliseconds) a queued text waits for the batch to fill.
+TIMEOUT_MS = 20
+
+
+class EmbeddingBatcher:
+    """
+    Thread-based dynamic batcher for embedding models.
+
+    A background dispatcher thread drains a queue of pending texts, waiting
+    up to TIMEOUT_MS for at most BATCH_SIZE entries, then runs one forward
+    pass over the whole batch and resolves each caller's future with its
+    own vector.
+    """
+
+    def __init__(self, embed_fn, batch_size=BATCH_SIZE, timeout_ms=TIMEOUT_MS):
+        """
+        Initializes the batcher and starts its dispatcher thread.
+
+        Args:
+            embed_fn (callable): Function mapping a list of texts to an
+                array of embedding vectors, one row per text.
+            batch_size (int): Maximum texts embedded together.
+            timeout_ms (int): Maximum wait for a batch to fill, in ms.
+        """
+        self._embed_fn = embed_fn
+        self._queue = queue.Queue()
+        self._batch_size = batch_size
+        self._timeout = timeout_ms / 1000.0
+        dispatcher = threading.Thread(target=self._dispatch_loop, daemon=True)
+        dispatcher.start()
+
+    def embed(self, texts):
+        """
+        Submits texts for batched embedding and blocks until the vectors
+        are available.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            list: One embedding vector per input text, in input order.
+        """
+        futures = []
+        for text in texts:
+            future = Future()
+            self._queue.put((text, future))
+            futures.append(future)
+        return [future.result() for future in futures]
+
+    def _dispatch_loop(self):
+        """
+        Collects queued texts into batches and embeds each batch in one
+        forward pass.
+        """
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._timeout
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                vectors = self._embed_fn([text for text, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), vector in zip(batch, vectors):
+                future.set_result(vector)
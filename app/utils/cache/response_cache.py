@@ -0,0 +1,64 @@
+"""
+Provides a disk-backed cache for OpenAI-generated texts keyed on the exact
+(job description, CV, language) triple. Living on disk lets all worker
+processes share hits, and repeat evaluations skip the OpenAI round-trip
+entirely.
+"""
+
+import hashlib
+import os
+import diskcache
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+OUTPUT_DIR = os.getenv("OUTPUT_DIR")
+
+# Cached responses expire after seven days
+EXPIRE_SECONDS = 86400 * 7
+
+# Shared cache directory next to the generated output files
+_cache = diskcache.Cache(os.path.join(OUTPUT_DIR or ".", ".gpt_cache"))
+
+
+def response_key(*parts):
+    """
+    Builds a stable cache key from the given text parts.
+
+    Args:
+        *parts (str): Texts identifying the request (e.g., a label, job
+            description, CV text, and language).
+
+    Returns:
+        str: Hex digest usable as the cache key.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def cached_response(key):
+    """
+    Looks up a cached response.
+
+    Args:
+        key (str): Key built with response_key.
+
+    Returns:
+        The cached value, or None when absent or expired.
+    """
+    return _cache.get(key)
+
+
+def store_response(key, response, expire=EXPIRE_SECONDS):
+    """
+    Stores a generated response.
+
+    Args:
+        key (str): Key built with response_key.
+        response: The generated value to cache.
+        expire (int): Lifetime of the entry in seconds.
+    """
+    _cache.set(key, response, expire=expire)
@@ -0,0 +1,131 @@
+"""
+Provides a semantic cache for OpenAI-generated texts. Responses are stored
+together with a Universal Sentence Encoder (USE) embedding of the request
+text, so near-duplicate requests (very common with job-board descriptions)
+are answered from the cache instead of a new OpenAI call.
+"""
+
+import hashlib
+import threading
+import numpy as np
+from app.utils.evaluation.cv_matcher import embed_text
+
+# Minimum cosine similarity between a request and a stored entry for the
+# stored response to be reused.
+SIMILARITY_THRESHOLD = 0.92
+
+# Maximum number of cached responses kept per language.
+MAX_ENTRIES_PER_LANGUAGE = 512
+
+
+class SemanticCache:
+    """
+    In-memory semantic cache keyed on sentence embeddings.
+
+    Entries are grouped by language so that a cached English letter is never
+    returned for a German request. Lookups embed the request text once and
+    compare it against the stored (normalized) embeddings with a dot product,
+    which equals cosine similarity for unit vectors.
+    """
+
+    def __init__(self, threshold=SIMILARITY_THRESHOLD,
+                 max_entries=MAX_ENTRIES_PER_LANGUAGE):
+        """
+        Initializes an empty cache.
+
+        Args:
+            threshold (float): Minimum cosine similarity for a cache hit.
+            max_entries (int): Maximum number of entries kept per language.
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # language -> {"keys": set of digests, "vectors": list, "responses": list}
+        self._buckets = {}
+
+    @staticmethod
+    def _embed(text):
+        """
+        Embeds the given text as a normalized vector through the shared
+        embedding path, which works with either backend (TF Hub or ONNX
+        Runtime) and reuses its cache and batcher.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            numpy.ndarray: A normalized float32 embedding vector.
+        """
+        return embed_text(text)
+
+    @staticmethod
+    def _digest(language, vector):
+        """
+        Builds an exact-match key for a (language, embedding) pair.
+
+        Args:
+            language (str): The language of the cached response.
+            vector (numpy.ndarray): The normalized embedding vector.
+
+        Returns:
+            str: A hex digest identifying the entry.
+        """
+        return hashlib.sha256(
+            language.encode("utf-8") + vector.tobytes()
+        ).hexdigest()
+
+    def lookup(self, text, language):
+        """
+        Looks up a cached response for text semantically close to the input.
+
+        Args:
+            text (str): The request text (e.g., job description).
+            language (str): The language of the requested response.
+
+        Returns:
+            tuple: (response, vector) where response is the cached text or
+                   None when no entry is close enough, and vector is the
+                   request embedding, to be passed back to insert so a
+                   miss does not embed the same text twice.
+        """
+        vector = self._embed(text)
+        with self._lock:
+            bucket = self._buckets.get(language)
+            if not bucket or not bucket["vectors"]:
+                return None, vector
+            scores = np.asarray(bucket["vectors"]) @ vector
+            best = int(np.argmax(scores))
+            if scores[best] >= self.threshold:
+                return bucket["responses"][best], vector
+        return None, vector
+
+    def insert(self, vector, language, response):
+        """
+        Stores a generated response under the embedding of its request
+        text, as previously returned by lookup.
+
+        Args:
+            vector (numpy.ndarray): The request embedding from lookup.
+            language (str): The language of the response.
+            response (str): The generated response to cache.
+        """
+        digest = self._digest(language, vector)
+        with self._lock:
+            bucket = self._buckets.setdefault(
+                language, {"keys": set(), "vectors": [], "responses": []}
+            )
+            if digest in bucket["keys"]:
+                return
+            if len(bucket["responses"]) >= self.max_entries:
+                bucket["keys"].discard(
+                    self._digest(language, bucket["vectors"][0])
+                )
+                bucket["vectors"].pop(0)
+                bucket["responses"].pop(0)
+            bucket["keys"].add(digest)
+            bucket["vectors"].append(vector)
+            bucket["responses"].append(response)
+
+
+# Shared cache instance for cover letter generation
+cover_letter_cache = SemanticCache()
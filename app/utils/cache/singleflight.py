@@ -0,0 +1,62 @@
+"""
+Deduplicates concurrent identical requests. When several callers ask for the
+same expensive result at the same time (client retries, double submits),
+only the first actually executes it; the others wait on the same future and
+share its result instead of launching duplicate OpenAI calls.
+"""
+
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty in-flight call map.
+        """
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def execute(self, key, fn, *args, **kwargs):
+        """
+        Runs fn(*args, **kwargs), unless an identical call (same key) is
+        already in flight, in which case the caller blocks on that call's
+        future and receives the shared result.
+
+        Args:
+            key (hashable): Identity of the request being executed.
+            fn (callable): The function producing the result.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            The function's result; re-raises any exception it raised.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+
+# Shared single-flight map for OpenAI-backed request handlers
+single_flight = SingleFlight()
@@ -0,0 +1,24 @@
+"""
+Creates the single OpenAI client shared by all modules. Reusing one client
+keeps a pooled HTTP transport alive across requests, so concurrent calls
+reuse warm connections instead of paying a TCP/TLS handshake each time.
+"""
+
+import os
+import httpx
+from dotenv import load_dotenv
+from openai import OpenAI
+
+# Load environment variables
+load_dotenv()
+
+# Shared client with a pooled, keep-alive HTTP transport
+openai_client = OpenAI(
+    api_key=os.getenv("OPENAI_API_KEY"),
+    http_client=httpx.Client(
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50
+        )
+    )
+)
@@ -1,21 +1,178 @@
 """
-Generates a professional and structured cover letter using OpenAI GPT-4.
+Generates a professional and structured cover letter using OpenAI.
 """
 
-import openai
 import os
+from openai import OpenAIError
+from app.utils.cache.semantic_cache import cover_letter_cache
+from app.utils.client.openai_client import openai_client
 
-# Load API Key
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+# Default model for cover letters; the letters are short-form, so the fast
+# tier is the default and heavier models are opt-in per request.
+DEFAULT_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 
-def generate_cover_letter(job_description, language='english'):
+# Quality tiers callers can request via the optional 'quality' field
+QUALITY_MODELS = {
+    "fast": "gpt-4o-mini",
+    "balanced": "gpt-4o",
+    "best": "gpt-4-turbo"
+}
+
+
+def resolve_model(quality=None):
+    """
+    Maps a requested quality tier to a model name.
+
+    Args:
+        quality (str): Optional tier ('fast', 'balanced', 'best').
+
+    Returns:
+        str: The model to use; the default model when the tier is missing
+             or unknown.
+    """
+    if quality:
+        return QUALITY_MODELS.get(quality.lower(), DEFAULT_MODEL)
+    return DEFAULT_MODEL
+
+
+# Invariant instructions shared by every cover letter call. Keeping this
+# prefix byte-identical across requests (no per-request interpolation) lets
+# OpenAI's server-side prompt cache skip prefill on the instruction tokens;
+# the variable parts (language, job description, CV) go in the user message.
+# The prefix is deliberately padded past the ~1024-token minimum the cache
+# requires to activate, so trimming these guidelines forfeits the caching.
+SYSTEM_PROMPT = (
+    "You are an AI-powered career assistant that writes formal, engaging, "
+    "and professional cover letters on behalf of a job applicant. Each "
+    "request contains a 'Language' field, a job description, and "
+    "optionally the text of the applicant's CV. Apply the following "
+    "guidelines to every letter you write.\n\n"
+    "LANGUAGE\n"
+    "1. Write the entire letter in the language named in the 'Language' "
+    "field of the request, including the salutation and the closing "
+    "formula. Do not mix languages and do not append translations.\n"
+    "2. Use the spelling, punctuation, and formal register that a native "
+    "professional writer of that language would use in business "
+    "correspondence.\n"
+    "3. If the job description itself is written in a different language, "
+    "the 'Language' field still wins; only proper nouns such as company "
+    "names, product names, and job titles may stay in their original "
+    "form.\n\n"
+    "LENGTH AND STRUCTURE\n"
+    "4. Keep the letter concise, approximately 250-350 words of body text "
+    "excluding the signature block.\n"
+    "5. Open with a strong first paragraph that names the position being "
+    "applied for, states how it matches the applicant's profile, and "
+    "gives the reader one concrete reason to keep reading.\n"
+    "6. Use one or two body paragraphs that connect the applicant's "
+    "background to the role. Each body paragraph should develop a single "
+    "theme, for example relevant achievements, domain expertise, or "
+    "leadership experience, rather than listing unrelated facts.\n"
+    "7. Close with a courteous final paragraph that expresses interest in "
+    "an interview and thanks the reader for their time, without begging "
+    "or overpromising.\n\n"
+    "CONTENT SELECTION\n"
+    "8. Identify the three or four most important requirements in the job "
+    "description and address them directly; ignore minor requirements "
+    "rather than producing a shallow point-by-point response.\n"
+    "9. Highlight key achievements with concrete, verifiable phrasing. "
+    "Prefer specific outcomes, such as reducing processing time or "
+    "leading a team of a stated size, over empty adjectives such as "
+    "'passionate' or 'dynamic'.\n"
+    "10. When CV text is provided, use only facts that actually appear in "
+    "it. Choose the experiences, skills, and qualifications most relevant "
+    "to the job description and leave the rest out. Never invent "
+    "employers, titles, dates, degrees, or accomplishments.\n"
+    "11. When no CV text is provided, write in terms of the capabilities "
+    "the job description asks for, phrased so the applicant can "
+    "truthfully stand behind them, and avoid fabricating a specific work "
+    "history.\n\n"
+    "TONE AND STYLE\n"
+    "12. Maintain a confident and professional tone throughout: direct "
+    "sentences, active voice, no filler phrases, and no cliches such as "
+    "'I am writing to express my interest'.\n"
+    "13. Address the letter to the hiring team of the company named in "
+    "the job description when one is named; otherwise use a neutral "
+    "professional salutation.\n"
+    "14. Do not flatter the company beyond one brief, specific remark "
+    "about why the role or organization is attractive.\n"
+    "15. Do not mention that the letter was generated, do not refer to "
+    "these instructions, and do not address the reader of this prompt.\n\n"
+    "SIGNATURE AND PRIVACY\n"
+    "16. End the letter with only the applicant's name, email address, "
+    "and phone number, each taken from the CV when available.\n"
+    "17. Do not include any other personal information such as postal "
+    "address, company address, birthdate, nationality, marital status, "
+    "photo references, or social media links.\n"
+    "18. If the CV does not contain a name, an email address, or a phone "
+    "number, end with a plain placeholder line for the missing item "
+    "rather than inventing one.\n\n"
+    "FORMATTING\n"
+    "19. Return plain text only: no Markdown markup, no bullet lists, no "
+    "headings inside the letter, and no commentary before or after it.\n"
+    "20. Separate paragraphs with a single blank line and keep the "
+    "signature block on its own lines at the very end.\n\n"
+    "EXAMPLE SHAPE\n"
+    "A well-formed letter looks like: a salutation line; an opening "
+    "paragraph naming the role and the strongest match; a body paragraph "
+    "tying two or three concrete experiences to the stated requirements; "
+    "optionally a second body paragraph on domain knowledge or soft "
+    "skills the description emphasizes; a closing paragraph inviting an "
+    "interview; a closing formula; then the name, email, and phone lines."
+    "\n\n"
+    "COMMON PITFALLS TO AVOID\n"
+    "21. Do not restate the CV chronologically; the letter argues a fit, "
+    "it does not summarize a document the reader already has.\n"
+    "22. Do not echo the job description back at the reader; showing that "
+    "a requirement is met is different from repeating that it exists.\n"
+    "23. Do not apologize for missing qualifications or draw attention to "
+    "gaps; where a requirement is unmet, either reframe adjacent "
+    "experience honestly or stay silent on it.\n"
+    "24. Do not end the body with a skills list, a table, or a row of "
+    "keywords; every claim belongs inside a sentence.\n"
+    "25. Do not leave template placeholders such as bracketed company or "
+    "role names in the text; when a name is genuinely absent from the "
+    "request, phrase the sentence so no placeholder is needed.\n"
+    "26. Do not promise outcomes the applicant cannot control, such as "
+    "guaranteed results or immediate availability, unless the CV states "
+    "them.\n\n"
+    "QUALITY CHECK\n"
+    "Before returning the letter, verify that every statement is "
+    "supported by the request, that the length is within range, that the "
+    "language matches the 'Language' field, and that the signature block "
+    "contains nothing beyond name, email, and phone number."
+)
+
+def _build_prompt(job_description, language, cv_text=None):
+    """
+    Builds the variable user message for a cover letter request.
+
+    Args:
+        job_description (str): The job description provided by the user.
+        language (str): The language for the cover letter.
+        cv_text (str): Extracted CV text, or None when unavailable.
+
+    Returns:
+        str: The user message containing only the request-specific parts.
     """
-    Generates a structured and tailored cover letter using OpenAI GPT-4 API
+    prompt = (
+        "Language: " + language + "\n\n"
+        "Job Description:\n" + job_description
+    )
+    if cv_text is not None:
+        prompt += "\n\nCV Text:\n" + cv_text
+    return prompt
+
+
+def generate_cover_letter(job_description, language='english', quality=None):
+    """
+    Generates a structured and tailored cover letter using the OpenAI API
     based only on the job description.
 
     Args:
         job_description (str): The job description provided by the user.
         language (str): The language for the cover letter.
+        quality (str): Optional quality tier ('fast', 'balanced', 'best').
 
     Returns:
         str: The generated cover letter text with personal details at the end.
@@ -23,51 +180,47 @@ def generate_cover_letter(job_description, language='english'):
     Raises:
         Exception: If an error occurs with the OpenAI API.
     """
-    openai.api_key = OPENAI_API_KEY
+    model = resolve_model(quality)
+    cache_key = language + "|" + model
 
-    prompt = (
-        "You are an AI-powered career assistant. Create a formal, engaging, and "
-        "professional cover letter tailored to the following job description. "
-        "Use " + language + " for the letter. Ensure that the letter is concise, "
-        "highlights key achievements relevant to the job, and maintains a "
-        "confident and professional tone. The letter should be approximately "
-        "250-350 words.\n\nJob Description:\n" + job_description +
-        "\n\nPlease ensure that the applicant's name, email, and phone number "
-        "appear at the end of the letter. Do not include any other personal "
-        "information such as address, company address, birthdate, etc."
+    # Return a cached letter for near-duplicate job descriptions; the
+    # vector is reused on insert so a miss embeds the text only once
+    cached_letter, cache_vector = cover_letter_cache.lookup(
+        job_description, cache_key
     )
+    if cached_letter is not None:
+        return cached_letter
+
+    prompt = _build_prompt(job_description, language)
 
     try:
-        response = openai.ChatCompletion.create(
-            model="gpt-4-turbo",
+        response = openai_client.chat.completions.create(
+            model=model,
             messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "Generate a professional cover letter in " + language +
-                        ", with only the applicant's name, email, and phone number "
-                        "at the end."
-                    )
-                },
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.6,
-            max_tokens=1000
+            max_tokens=600
         )
-        return response['choices'][0]['message']['content'].strip()
+        cover_letter = response.choices[0].message.content.strip()
+        cover_letter_cache.insert(cache_vector, cache_key, cover_letter)
+        return cover_letter
 
-    except openai.error.OpenAIError as e:
+    except OpenAIError as e:
         raise Exception(f"OpenAI API Error: {str(e)}")
 
-def generate_cover_letter_with_cv(job_description, cv_text, language='english'):
+def generate_cover_letter_with_cv(job_description, cv_text,
+                                  language='english', quality=None):
     """
-    Generates a structured and tailored cover letter using OpenAI GPT-4 API
+    Generates a structured and tailored cover letter using the OpenAI API
     with both job description and CV text.
 
     Args:
         job_description (str): The job description provided by the user.
         cv_text (str): Extracted text from the user's CV.
         language (str): The language for the cover letter.
+        quality (str): Optional quality tier ('fast', 'balanced', 'best').
 
     Returns:
         str: The generated cover letter text with personal details at the end.
@@ -75,40 +228,122 @@ def generate_cover_letter_with_cv(job_description, cv_text, language='english'):
     Raises:
         Exception: If an error occurs with the OpenAI API.
     """
-    openai.api_key = OPENAI_API_KEY
+    model = resolve_model(quality)
+    cache_key = language + "|" + model
 
-    prompt = (
-        "You are an AI-powered career assistant. Create a cover letter in " +
-        language + " that analyzes and reflects both the provided job " +
-        "description and the candidate's CV. Ensure that the letter is " +
-        "professionally structured, emphasizing the candidate's qualifications " +
-        "and experiences relevant to the job, and adheres to a confident and " +
-        "professional tone. The cover letter should be between 250-350 words.\n\n" +
-        "Job Description:\n" + job_description + "\n\n" +
-        "CV Text:\n" + cv_text + "\n\n" +
-        "Please ensure that the applicant's name, email, and phone number appear " +
-        "at the end of the letter. Do not include any other personal information " +
-        "such as address, company address, birthdate, etc."
+    # Return a cached letter for near-duplicate job description + CV
+    # pairs; the vector is reused on insert so a miss embeds once
+    cache_text = job_description + "\n" + cv_text
+    cached_letter, cache_vector = cover_letter_cache.lookup(
+        cache_text, cache_key
+    )
+    if cached_letter is not None:
+        return cached_letter
+
+    prompt = _build_prompt(job_description, language, cv_text)
+
+    try:
+        response = openai_client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.6,
+            max_tokens=600
+        )
+        cover_letter = response.choices[0].message.content.strip()
+        cover_letter_cache.insert(cache_vector, cache_key, cover_letter)
+        return cover_letter
+
+    except OpenAIError as e:
+        raise Exception(f"OpenAI API Error: {str(e)}")
+
+def _stream_completion(cache_text, prompt, language, quality=None):
+    """
+    Streams a cover letter completion from OpenAI chunk by chunk.
+
+    Args:
+        cache_text (str): The text used as the semantic cache key.
+        prompt (str): The user message for the completion.
+        language (str): The language for the cover letter.
+        quality (str): Optional quality tier ('fast', 'balanced', 'best').
+
+    Yields:
+        str: Successive fragments of the generated cover letter.
+
+    Raises:
+        Exception: If an error occurs with the OpenAI API.
+    """
+    model = resolve_model(quality)
+    cache_key = language + "|" + model
+
+    # A cached letter is yielded in one piece; the vector is reused on
+    # insert so a miss embeds the text only once
+    cached_letter, cache_vector = cover_letter_cache.lookup(
+        cache_text, cache_key
     )
+    if cached_letter is not None:
+        yield cached_letter
+        return
 
     try:
-        response = openai.ChatCompletion.create(
-            model="gpt-4-turbo",
+        response = openai_client.chat.completions.create(
+            model=model,
             messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "Generate a professional cover letter in " + language +
-                        ", with only the applicant's name, email, and phone number "
-                        "at the end."
-                    )
-                },
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.6,
-            max_tokens=1000
+            max_tokens=600,
+            stream=True
+        )
+        collected = []
+        for chunk in response:
+            content = chunk.choices[0].delta.content if chunk.choices else None
+            if content:
+                collected.append(content)
+                yield content
+        cover_letter_cache.insert(
+            cache_vector, cache_key, "".join(collected).strip()
         )
-        return response['choices'][0]['message']['content'].strip()
 
-    except openai.error.OpenAIError as e:
+    except OpenAIError as e:
         raise Exception(f"OpenAI API Error: {str(e)}")
+
+def stream_cover_letter(job_description, language='english', quality=None):
+    """
+    Streams a cover letter generated from the job description only.
+
+    Args:
+        job_description (str): The job description provided by the user.
+        language (str): The language for the cover letter.
+        quality (str): Optional quality tier ('fast', 'balanced', 'best').
+
+    Returns:
+        generator: Yields fragments of the cover letter as they arrive.
+    """
+    return _stream_completion(
+        job_description, _build_prompt(job_description, language),
+        language, quality
+    )
+
+def stream_cover_letter_with_cv(job_description, cv_text,
+                                language='english', quality=None):
+    """
+    Streams a cover letter generated from the job description and CV text.
+
+    Args:
+        job_description (str): The job description provided by the user.
+        cv_text (str): Extracted text from the user's CV.
+        language (str): The language for the cover letter.
+        quality (str): Optional quality tier ('fast', 'balanced', 'best').
+
+    Returns:
+        generator: Yields fragments of the cover letter as they arrive.
+    """
+    cache_text = job_description + "\n" + cv_text
+    return _stream_completion(
+        cache_text, _build_prompt(job_description, language, cv_text),
+        language, quality
+    )
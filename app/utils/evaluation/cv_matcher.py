@@ -3,64 +3,221 @@ Handles CV and job description similarity analysis using Universal
 Sentence Encoder (USE) for multilingual support.
 """
 
+import hashlib
 import os
-import tensorflow_hub as hub
+from collections import OrderedDict
+import numba
+import numpy as np
 import nltk
 from nltk.corpus import stopwords
-from sklearn.metrics.pairwise import cosine_similarity
 from dotenv import load_dotenv
-import openai
-from language.supported_languages import SUPPORTED_LANGUAGES
+from app.utils.batch.embedding_batcher import EmbeddingBatcher
+from app.utils.evaluation.full_report import generate_full_report
+from language.supported_languages import SUPPORTED_CODES, SUPPORTED_LANGUAGES
 
 # Load environment variables
 load_dotenv()
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 USE_MODEL_URL = os.getenv("UNIVERSAL_SENTENCE_ENCODER_URL")
+USE_ONNX_MODEL_PATH = os.getenv("USE_ONNX_MODEL_PATH")
 
-# Load Universal Sentence Encoder (USE) from TensorFlow Hub
-embed = hub.load(USE_MODEL_URL)
+# Serve USE through ONNX Runtime when a converted model is available
+# (see tools/convert_use_to_onnx.py); CPU inference through onnxruntime
+# is several times faster than the TF SavedModel and skips loading
+# TensorFlow entirely. Without the ONNX file, fall back to TF Hub.
+if USE_ONNX_MODEL_PATH and os.path.exists(USE_ONNX_MODEL_PATH):
+    import onnxruntime
+
+    _session_options = onnxruntime.SessionOptions()
+    _session_options.intra_op_num_threads = os.cpu_count()
+    _onnx_session = onnxruntime.InferenceSession(
+        USE_ONNX_MODEL_PATH,
+        sess_options=_session_options,
+        providers=["CPUExecutionProvider"]
+    )
+    _ONNX_INPUT_NAME = _onnx_session.get_inputs()[0].name
+
+    def _embed_forward(texts):
+        """
+        Runs one batched USE forward pass through ONNX Runtime.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            numpy.ndarray: One embedding row per input text.
+        """
+        inputs = {_ONNX_INPUT_NAME: np.asarray(texts, dtype=object)}
+        return _onnx_session.run(None, inputs)[0]
+else:
+    import tensorflow as tf
+    import tensorflow_hub as hub
+
+    # Load Universal Sentence Encoder (USE) from TensorFlow Hub
+    embed = hub.load(USE_MODEL_URL)
+
+    # Wrap USE in a tf.function with a fixed input signature so every call
+    # reuses one traced graph instead of retracing per invocation
+    _embed_fn = tf.function(
+        embed, input_signature=[tf.TensorSpec([None], tf.string)]
+    )
+
+    def _embed_forward(texts):
+        """
+        Runs one batched USE forward pass over the given texts.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            numpy.ndarray: One embedding row per input text.
+        """
+        return _embed_fn(tf.constant(texts)).numpy()
+
+
+# Warm the embedding path at process start: the first TF call pays the
+# multi-second graph trace (and ONNX its session spin-up), so take that
+# hit at import instead of on the first user request
+_embed_forward(["warmup"])
+
+
+# Coalesces embed calls from concurrent requests into shared forward passes
+_embed_batcher = EmbeddingBatcher(_embed_forward)
+
+# Embeddings keyed by text content hash, evicted least-recently-used first.
+# Users iterate on the same CV and job description (retries, multiple
+# endpoints, language passes), so repeat texts skip the USE forward pass.
+_EMBEDDING_CACHE = OrderedDict()
+_EMBEDDING_CACHE_SIZE = 4096
+
+
+def _embed_many(texts):
+    """
+    Embeds several texts in a single USE forward pass, serving repeats
+    from the embedding cache.
+
+    Args:
+        texts (list): Preprocessed texts to embed.
+
+    Returns:
+        list: Contiguous float32 embedding vectors, one per input text.
+    """
+    keys = [
+        hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        for text in texts
+    ]
+    vectors = [None] * len(texts)
+    miss_indices = []
+    for i, key in enumerate(keys):
+        cached = _EMBEDDING_CACHE.get(key)
+        if cached is not None:
+            _EMBEDDING_CACHE.move_to_end(key)
+            vectors[i] = cached
+        else:
+            miss_indices.append(i)
+    if miss_indices:
+        batch = _embed_batcher.embed([texts[i] for i in miss_indices])
+        for row, i in zip(batch, miss_indices):
+            vector = np.ascontiguousarray(row, dtype=np.float32)
+            # L2-normalize once so similarity is a plain dot product
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                vector /= norm
+            _EMBEDDING_CACHE[keys[i]] = vector
+            vectors[i] = vector
+        while len(_EMBEDDING_CACHE) > _EMBEDDING_CACHE_SIZE:
+            _EMBEDDING_CACHE.popitem(last=False)
+    return vectors
+
+
+def embed_text(text):
+    """
+    Embeds a single text with whichever backend is active (TF Hub or
+    ONNX Runtime), sharing the embedding cache and batcher with the
+    similarity path.
+
+    Args:
+        text (str): The text to embed.
+
+    Returns:
+        numpy.ndarray: A contiguous, L2-normalized float32 vector.
+    """
+    return _embed_many([text])[0]
 
 # Ensure NLTK stopwords are available
 nltk.download('stopwords', quiet=True)
 
 
+@numba.njit(cache=True, nogil=True, fastmath=True)
+def _dot_kernel(vec_a, vec_b):
+    """
+    Computes the dot product of two contiguous float32 vectors. Equals
+    cosine similarity when both vectors are L2-normalized, which the
+    embedding cache guarantees.
+
+    Args:
+        vec_a (numpy.ndarray): First normalized embedding vector.
+        vec_b (numpy.ndarray): Second normalized embedding vector.
+
+    Returns:
+        float: Dot product of the two vectors.
+    """
+    total = 0.0
+    for i in range(vec_a.shape[0]):
+        total += vec_a[i] * vec_b[i]
+    return total
+
+
+# Warm the JIT at import time so the one-time compile cost is paid off the
+# request path
+_dot_kernel(
+    np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.float32)
+)
+
+
+# Stopword sets resolved once at import. NLTK stores them under full
+# language names ('english', 'turkish', ...), so map from the app's
+# two-letter codes; frozensets give cheap immutable membership tests.
+_STOPWORDS = {
+    code: frozenset(stopwords.words(name.lower()))
+    for code, name in SUPPORTED_LANGUAGES.items()
+    if name.lower() in stopwords.fileids()
+}
+
+
 def get_stopwords(language):
     """
-    Retrieves stopwords dynamically using NLTK.
-    
+    Retrieves the precomputed stopword set for a language code.
+
     Args:
         language (str): Language code.
-    
+
     Returns:
-        set: A set of stopwords for the given language, or an empty set
-             if not available.
+        frozenset: Stopwords for the given language, or an empty set if
+                   not available.
     """
-    try:
-        if language in stopwords.fileids():
-            return set(stopwords.words(language))
-    except LookupError:
-        nltk.download('stopwords', quiet=True)
-        if language in stopwords.fileids():
-            return set(stopwords.words(language))
-    return set()
+    return _STOPWORDS.get(language, frozenset())
 
 
 def preprocess_text(text, language):
     """
-    Removes stopwords from the given text dynamically.
-    
+    Lowercases the given text and removes stopwords.
+
     Args:
         text (str): The input text.
         language (str): Language code.
-    
+
     Returns:
         str: Processed text with stopwords removed.
     """
     stop_words = get_stopwords(language)
-    words = text.split()
-    filtered_words = [word for word in words 
-                      if word.lower() not in stop_words]
-    return " ".join(filtered_words)
+    # One C-level lower() on the whole text instead of a Python-level
+    # .lower() call per word
+    lowered = text.lower()
+    if not stop_words:
+        return lowered
+    return " ".join(
+        word for word in lowered.split() if word not in stop_words
+    )
 
 
 def compute_similarity_score(job_description, cv_text, language="en"):
@@ -83,17 +240,16 @@ def compute_similarity_score(job_description, cv_text, language="en"):
     if not job_description.strip() or not cv_text.strip():
         raise ValueError("Job description and CV text cannot be empty.")
     
-    if language not in SUPPORTED_LANGUAGES:
+    if language not in SUPPORTED_CODES:
         raise ValueError(f"Unsupported language: {language}")
     
     try:
         job_clean = preprocess_text(job_description, language)
         cv_clean = preprocess_text(cv_text, language)
         
-        job_vector = embed([job_clean]).numpy()
-        cv_vector = embed([cv_clean]).numpy()
+        job_vector, cv_vector = _embed_many([job_clean, cv_clean])
         
-        similarity = cosine_similarity(job_vector, cv_vector)[0][0]
+        similarity = _dot_kernel(job_vector, cv_vector)
         return float(similarity)
     
     except Exception as e:
@@ -103,49 +259,24 @@ def compute_similarity_score(job_description, cv_text, language="en"):
 def evaluate_cv_with_openai(job_description, cv_text, language='english'):
     """
     Generates a professional evaluation of how well a candidate's CV matches 
-    the job description using OpenAI's GPT model. The evaluation considers 
-    language-specific nuances and provides insights into the candidate's 
+    the job description using OpenAI's GPT model. The evaluation considers
+    language-specific nuances and provides insights into the candidate's
     strengths, gaps, and overall suitability.
-    
+
+    Delegates to the fused full-report call, so a session that requests
+    both the evaluation and the interview questions pays for one OpenAI
+    round-trip.
+
     Args:
         job_description (str): The text of the job description.
         cv_text (str): The text extracted from the candidate's CV.
         language (str): The language for generating the evaluation.
-    
+
     Returns:
         str: An AI-generated professional evaluation report.
-    
+
     Raises:
         Exception: If there is an error while communicating with the OpenAI API.
     """
-    openai.api_key = os.getenv("OPENAI_API_KEY")
-    
-    prompt = (
-        "As an HR manager, you are tasked with evaluating how well a candidate's "
-        "CV matches the job description provided. Conduct a thorough analysis and "
-        "provide feedback on:\n\n"
-        "1. Key strengths that align well with the job requirements.\n"
-        "2. Areas where the candidate may lack the necessary qualifications or "
-        "experience.\n"
-        "3. A final recommendation on the candidate's suitability for the position.\n\n"
-        "Please deliver your evaluation in " + language + ".\n\n"
-        "Job Description:\n" + job_description + "\n\n" +
-        "CV Content:\n" + cv_text
-    )
-    
-    try:
-        response = openai.ChatCompletion.create(
-            model="gpt-4-turbo",
-            messages=[
-                {"role": "system", 
-                 "content": ("Provide a detailed professional evaluation in " +
-                             language + ".")},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=2000
-        )
-        evaluation = response['choices'][0]['message']['content'].strip()
-        return evaluation
-    except openai.error.OpenAIError as e:
-        raise Exception(f"OpenAI API Error: {str(e)}")
+    report = generate_full_report(job_description, cv_text, language)
+    return report["evaluation"]
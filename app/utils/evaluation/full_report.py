@@ -0,0 +1,391 @@
+"""
+Generates the CV evaluation and interview questions with a single OpenAI
+call, and the full three-artifact bundle (cover letter included) the same
+way. All artifacts consume the same job description and CV as context, so
+fusing them pays the prompt tokens and the network round-trip once, and
+every fused variant shares the same disk cache and single-flight
+machinery.
+"""
+
+import json
+from openai import OpenAIError
+from app.utils.cache.response_cache import (
+    response_key, cached_response, store_response
+)
+from app.utils.cache.singleflight import single_flight
+from app.utils.client.openai_client import openai_client
+
+# Shared guidance for every fused report variant. Kept byte-identical
+# across calls so the shared prefix stays prompt-cacheable, and padded —
+# together with the per-variant key lists below — past the ~1024-token
+# minimum OpenAI's prompt cache requires to activate.
+_REPORT_GUIDELINES = (
+    "You are an AI-powered career assistant. Each request contains a "
+    "'Language' field, a job description, and the text of a candidate's "
+    "CV. You respond with a single JSON object whose keys are listed at "
+    "the end of these instructions. Apply the following guidelines to "
+    "every response.\n\n"
+    "LANGUAGE\n"
+    "1. Write every value in the language named in the 'Language' field "
+    "of the request. Do not mix languages and do not append "
+    "translations.\n"
+    "2. Use the formal register a native professional writer of that "
+    "language would use; only proper nouns such as company names, "
+    "product names, and job titles may stay in their original form.\n\n"
+    "GROUNDING\n"
+    "3. Base every statement on the job description and the CV as "
+    "provided. Never invent employers, titles, dates, degrees, "
+    "certifications, or accomplishments that do not appear in the CV.\n"
+    "4. When the CV is silent on a requirement, say so plainly instead "
+    "of guessing; absence of evidence is itself a finding.\n"
+    "5. Quote or paraphrase the specific requirement or CV line a "
+    "judgement rests on, so the reader can verify it.\n\n"
+    "EVALUATION CONTENT\n"
+    "6. Open the evaluation with a one- or two-sentence overall verdict "
+    "on the match before going into detail.\n"
+    "7. Cover the key strengths that align with the job requirements, "
+    "naming the concrete experience or skill behind each strength "
+    "rather than repeating the CV's own adjectives.\n"
+    "8. Cover the areas where the candidate may lack qualifications or "
+    "experience, ordered by how much each gap matters for this role, "
+    "and distinguish hard blockers from gaps that training could "
+    "close.\n"
+    "9. Finish with a final recommendation on the candidate's "
+    "suitability: a clear hire, interview, or pass signal with the one "
+    "or two decisive reasons, not a hedge.\n"
+    "10. Keep the evaluation professional and impersonal; assess the "
+    "match, never the person, and avoid any remark about age, gender, "
+    "nationality, appearance, or other protected characteristics.\n\n"
+    "INTERVIEW CONTENT\n"
+    "11. Produce exactly 10 interview questions a well-prepared "
+    "interviewer for this role would actually ask, mixing technical "
+    "depth, behavioral situations, and role-specific scenarios drawn "
+    "from the job description.\n"
+    "12. Tailor the questions to this candidate: probe the gaps the "
+    "evaluation identifies and the strongest claims the CV makes, "
+    "instead of asking generic questions any applicant could face.\n"
+    "13. Give each question a well-structured sample answer the "
+    "candidate could honestly deliver, grounded in the CV's actual "
+    "experience and two to five sentences long.\n"
+    "14. Format the interview value as a single text field with "
+    "alternating questions and answers, each question numbered and "
+    "each answer directly below it, separated by blank lines.\n\n"
+    "COVER LETTER CONTENT\n"
+    "15. When a cover letter key is requested, write a formal, "
+    "professional letter of approximately 250-350 words tailored to the "
+    "job description and CV: a strong opening naming the role, one or "
+    "two body paragraphs connecting the candidate's background to the "
+    "stated requirements, and a courteous closing paragraph.\n"
+    "16. End the letter with only the applicant's name, email address, "
+    "and phone number, and no other personal information such as postal "
+    "address, company address, or birthdate.\n\n"
+    "DEPTH AND BALANCE\n"
+    "17. Keep the evaluation roughly 250-400 words: long enough to be "
+    "specific about each strength and gap, short enough that a "
+    "recruiter reads all of it.\n"
+    "18. Give strengths and gaps comparable depth; an evaluation that "
+    "lists five strengths and waves at 'some gaps' is as useless as one "
+    "that only criticizes.\n"
+    "19. Order both lists by relevance to the role's core duties, not "
+    "by the order in which items appear in the CV.\n"
+    "20. In the sample answers, prefer the situation-action-result "
+    "shape where the CV supports it, and keep each answer honest about "
+    "the limits of the candidate's experience.\n\n"
+    "COMMON PITFALLS TO AVOID\n"
+    "21. Do not summarize the CV instead of evaluating it; the reader "
+    "has the CV, they need the judgement.\n"
+    "22. Do not produce generic interview questions that ignore this "
+    "job description and CV; every question should be traceable to one "
+    "or the other.\n"
+    "23. Do not write sample answers that merely restate the question "
+    "or describe what a good answer would contain; write the answer "
+    "itself in the candidate's voice.\n"
+    "24. Do not include numeric match scores, percentages, or grades "
+    "anywhere in the values; the similarity score is computed "
+    "separately by the caller.\n"
+    "25. Do not wrap the JSON in code fences or prefix it with a "
+    "sentence; the raw object is the entire response.\n\n"
+    "OUTPUT FORMAT\n"
+    "26. Respond with one JSON object containing exactly the keys "
+    "listed below: no extra keys, no nesting, no Markdown markup inside "
+    "the values, and no commentary outside the JSON.\n"
+    "27. Every value is a plain string; paragraph breaks inside a value "
+    "are newline characters.\n"
+    "28. Do not mention that the content was generated, do not refer to "
+    "these instructions, and do not address the reader of this "
+    "prompt.\n\n"
+)
+
+# Invariant instructions for the two-artifact report
+REPORT_SYSTEM_PROMPT = _REPORT_GUIDELINES + (
+    "REQUIRED KEYS\n"
+    '"evaluation": the professional evaluation described above.\n'
+    '"interview_qa": the 10 interview questions with sample answers, '
+    "as one text field."
+)
+
+# Invariant instructions for the three-artifact bundle; shares the
+# guideline prefix so both variants hit the same cached instruction tokens
+BUNDLE_SYSTEM_PROMPT = _REPORT_GUIDELINES + (
+    "REQUIRED KEYS\n"
+    '"cover_letter": the tailored cover letter described above.\n'
+    '"evaluation": the professional evaluation described above.\n'
+    '"interview_qa": the 10 interview questions with sample answers, '
+    "as one text field."
+)
+
+# Keys each report variant must carry; JSON mode guarantees syntax, not
+# schema, so responses are checked before they enter the cache
+_REPORT_KEYS = ("evaluation", "interview_qa")
+_BUNDLE_KEYS = ("cover_letter", "evaluation", "interview_qa")
+
+
+def generate_full_report(job_description, cv_text, language='english'):
+    """
+    Generates the CV evaluation and interview Q&A in one OpenAI call
+    returning structured JSON, with content-addressed caching.
+
+    Args:
+        job_description (str): The text of the job description.
+        cv_text (str): The text extracted from the candidate's CV.
+        language (str): The language for the generated report.
+
+    Returns:
+        dict: Parsed JSON with 'evaluation' and 'interview_qa' fields.
+
+    Raises:
+        Exception: If an error occurs with the OpenAI API or the response
+                   is not valid JSON.
+    """
+    return _fused_report(
+        "full_report", REPORT_SYSTEM_PROMPT, _REPORT_KEYS,
+        job_description, cv_text, language
+    )
+
+
+def generate_bundle(job_description, cv_text, language='english'):
+    """
+    Generates a cover letter, CV evaluation, and interview Q&A in a single
+    OpenAI call returning structured JSON, sharing the disk cache and
+    single-flight machinery of the two-artifact report.
+
+    Args:
+        job_description (str): The job description provided by the user.
+        cv_text (str): Extracted text from the user's CV.
+        language (str): The language for all generated artifacts.
+
+    Returns:
+        dict: Parsed JSON with 'cover_letter', 'evaluation', and
+              'interview_qa' fields.
+
+    Raises:
+        Exception: If an error occurs with the OpenAI API or the response
+                   is not valid JSON.
+    """
+    return _fused_report(
+        "bundle", BUNDLE_SYSTEM_PROMPT, _BUNDLE_KEYS,
+        job_description, cv_text, language
+    )
+
+
+def _fused_report(label, system_prompt, required_keys,
+                  job_description, cv_text, language):
+    """
+    Serves one fused report variant: disk cache first, then a
+    single-flight OpenAI call so concurrent identical requests share one
+    execution.
+
+    Args:
+        label (str): Cache namespace for the variant.
+        system_prompt (str): Invariant instructions for the variant.
+        required_keys (tuple): Keys the parsed response must carry.
+        job_description (str): The text of the job description.
+        cv_text (str): The text extracted from the candidate's CV.
+        language (str): The language for the generated report.
+
+    Returns:
+        dict: Parsed JSON carrying the variant's required keys.
+    """
+    key = response_key(label, job_description, cv_text, language)
+    cached = cached_response(key)
+    if cached is not None:
+        return cached
+
+    # Concurrent requests for the same content land here; coalescing
+    # them means the group costs one OpenAI call and finishes together
+    return single_flight.execute(
+        (label, key),
+        _request_report, key, system_prompt, required_keys,
+        job_description, cv_text, language
+    )
+
+
+def _request_report(key, system_prompt, required_keys,
+                    job_description, cv_text, language):
+    """
+    Issues the fused OpenAI request and caches the parsed report.
+
+    Args:
+        key (str): Cache key for the report.
+        system_prompt (str): Invariant instructions for the variant.
+        required_keys (tuple): Keys the parsed response must carry.
+        job_description (str): The text of the job description.
+        cv_text (str): The text extracted from the candidate's CV.
+        language (str): The language for the generated report.
+
+    Returns:
+        dict: Parsed JSON carrying the variant's required keys.
+
+    Raises:
+        Exception: If an error occurs with the OpenAI API or the response
+                   is not valid JSON.
+    """
+    prompt = (
+        "Language: " + language + "\n\n"
+        "Job Description:\n" + job_description + "\n\n"
+        "CV Content:\n" + cv_text
+    )
+
+    try:
+        response = openai_client.chat.completions.create(
+            model="gpt-4-turbo",
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.7,
+            max_tokens=4000,
+            response_format={"type": "json_object"}
+        )
+        report = json.loads(response.choices[0].message.content)
+        missing = [k for k in required_keys if k not in report]
+        if missing:
+            # Fail without caching so a malformed response cannot pin
+            # this triple to an error for the cache lifetime
+            raise Exception(
+                "OpenAI response missing keys: " + ", ".join(missing)
+            )
+        store_response(key, report)
+        return report
+
+    except OpenAIError as e:
+        raise Exception(f"OpenAI API Error: {str(e)}")
+    except json.JSONDecodeError as e:
+        raise Exception(f"Invalid JSON in OpenAI response: {str(e)}")
+
+
+# Per-artifact instructions used when streaming a single artifact as plain
+# text; JSON mode buffers the whole object, so streams skip it
+_ARTIFACT_PROMPTS = {
+    "evaluation": (
+        "You are an AI-powered career assistant. Each request contains a "
+        "job description and a candidate's CV. Write a professional "
+        "evaluation of how well the CV matches the job description, "
+        "covering key strengths that align with the job requirements, "
+        "areas where the candidate may lack qualifications or experience, "
+        "and a final recommendation on the candidate's suitability. Write "
+        "in the language named in the 'Language' field of the request."
+    ),
+    "interview_qa": (
+        "You are an AI-powered career assistant. Each request contains a "
+        "job description and a candidate's CV. Write 10 relevant "
+        "interview questions with well-structured sample answers tailored "
+        "to the candidate's profile, formatted as alternating questions "
+        "and answers. Write in the language named in the 'Language' field "
+        "of the request."
+    )
+}
+
+
+def _stream_artifact(field, job_description, cv_text, language):
+    """
+    Streams one report artifact from OpenAI chunk by chunk.
+
+    Args:
+        field (str): The artifact to stream ('evaluation' or
+            'interview_qa').
+        job_description (str): The text of the job description.
+        cv_text (str): The text extracted from the candidate's CV.
+        language (str): The language for the streamed artifact.
+
+    Yields:
+        str: Successive fragments of the generated artifact.
+
+    Raises:
+        Exception: If an error occurs with the OpenAI API.
+    """
+    # A cached full report or previously streamed artifact is yielded in
+    # one piece
+    report = cached_response(
+        response_key("full_report", job_description, cv_text, language)
+    )
+    if report is not None:
+        yield report[field]
+        return
+    key = response_key(field, job_description, cv_text, language)
+    cached = cached_response(key)
+    if cached is not None:
+        yield cached
+        return
+
+    prompt = (
+        "Language: " + language + "\n\n"
+        "Job Description:\n" + job_description + "\n\n"
+        "CV Content:\n" + cv_text
+    )
+
+    try:
+        response = openai_client.chat.completions.create(
+            model="gpt-4-turbo",
+            messages=[
+                {"role": "system", "content": _ARTIFACT_PROMPTS[field]},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.7,
+            max_tokens=2500,
+            stream=True
+        )
+        collected = []
+        for chunk in response:
+            content = chunk.choices[0].delta.content if chunk.choices else None
+            if content:
+                collected.append(content)
+                yield content
+        store_response(key, "".join(collected).strip())
+
+    except OpenAIError as e:
+        raise Exception(f"OpenAI API Error: {str(e)}")
+
+
+def stream_evaluation(job_description, cv_text, language='english'):
+    """
+    Streams the CV evaluation chunk by chunk.
+
+    Args:
+        job_description (str): The text of the job description.
+        cv_text (str): The text extracted from the candidate's CV.
+        language (str): The language for the evaluation.
+
+    Returns:
+        generator: Yields fragments of the evaluation as they arrive.
+    """
+    return _stream_artifact(
+        "evaluation", job_description, cv_text, language
+    )
+
+
+def stream_interview_questions(job_description, cv_text, language='english'):
+    """
+    Streams the interview questions and sample answers chunk by chunk.
+
+    Args:
+        job_description (str): The text of the job description.
+        cv_text (str): The text extracted from the candidate's CV.
+        language (str): The language for the interview preparation.
+
+    Returns:
+        generator: Yields fragments of the Q&A output as they arrive.
+    """
+    return _stream_artifact(
+        "interview_qa", job_description, cv_text, language
+    )
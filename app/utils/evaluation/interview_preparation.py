@@ -2,18 +2,14 @@
 Generates interview questions and sample answers using OpenAI GPT-4 API.
 """
 
-import openai
-import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+from app.utils.evaluation.full_report import generate_full_report
 
 def generate_interview_questions(job_description, cv_text, language='english'):
     """
-    Generates 10 potential interview questions and CV-specific answers using
-    OpenAI GPT-4 API.
+    Generates 10 potential interview questions and CV-specific answers.
+
+    Delegates to the fused full-report call, so a session that requests
+    both the evaluation and the questions pays for one OpenAI round-trip.
 
     Args:
         job_description (str): The job description provided by the user.
@@ -27,40 +23,5 @@ def generate_interview_questions(job_description, cv_text, language='english'):
     Raises:
         Exception: If an error occurs while communicating with OpenAI API.
     """
-    openai.api_key = OPENAI_API_KEY
-
-    prompt = (
-        "You are an AI-based career assistant specializing in interview "
-        "preparation. Based on the job description and the candidate's CV, "
-        "generate 10 relevant interview questions that are likely to be "
-        "asked, with well-structured sample answers tailored to the candidate's "
-        "profile.\n\nJob Description:\n" + job_description +
-        "\n\nCandidate's CV:\n" + cv_text +
-        "\n\nPlease provide responses that are professional, detailed, and "
-        "aligned with the job role. Use " + language + " language for all responses."
-    )
-
-    try:
-        response = openai.ChatCompletion.create(
-            model="gpt-4-turbo",
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a professional AI career assistant writing in " +
-                        language + "."
-                    )
-                },
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=2500
-        )
-
-        formatted_response = (
-            response['choices'][0]['message']['content'].strip()
-        )
-        return formatted_response
-
-    except openai.error.OpenAIError as e:
-        raise Exception(f"OpenAI API Error: {str(e)}")
+    report = generate_full_report(job_description, cv_text, language)
+    return report["interview_qa"]
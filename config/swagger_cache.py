@@ -0,0 +1,52 @@
+"""
+Flasgger subclass that serves API specs from memory. Stock flasgger
+re-parses every route docstring on each GET of the spec endpoint; this
+variant answers from the precompiled spec file when one exists and
+otherwise parses the docstrings once and memoizes the result.
+"""
+
+import json
+from flasgger import Swagger
+
+
+class CachedSwagger(Swagger):
+    """
+    Swagger with an in-memory spec cache.
+
+    When a precompiled spec file is configured, the spec endpoint serves
+    its contents without ever touching the docstring parser; without one,
+    the first request pays the parse and later requests reuse it.
+    """
+
+    def __init__(self, *args, spec_file=None, **kwargs):
+        """
+        Initializes the wrapper around flasgger's Swagger.
+
+        Args:
+            spec_file (str): Path to a precompiled OpenAPI JSON file, or
+                None to parse route docstrings on first use.
+        """
+        self._spec_file = spec_file
+        self._spec_cache = {}
+        super().__init__(*args, **kwargs)
+
+    def get_apispecs(self, endpoint='apispec_1'):
+        """
+        Returns the spec for the given endpoint from the cache, loading
+        the precompiled file or parsing the docstrings on first use.
+
+        Args:
+            endpoint (str): Name of the spec endpoint being served.
+
+        Returns:
+            dict: The OpenAPI specification.
+        """
+        specs = self._spec_cache.get(endpoint)
+        if specs is None:
+            if self._spec_file:
+                with open(self._spec_file, encoding="utf-8") as spec_file:
+                    specs = json.load(spec_file)
+            else:
+                specs = super().get_apispecs(endpoint)
+            self._spec_cache[endpoint] = specs
+        return specs
@@ -2,6 +2,8 @@
 Defines supported languages for AI-Powered Job Application Assistant.
 """
 
+from functools import lru_cache
+
 SUPPORTED_LANGUAGES = {
     "en": "English",
     "tr": "Turkish",
@@ -12,6 +14,10 @@ SUPPORTED_LANGUAGES = {
     "nl": "Dutch"
 }
 
+# Frozenset of the language codes for hot-path membership checks
+SUPPORTED_CODES = frozenset(SUPPORTED_LANGUAGES)
+
+@lru_cache(maxsize=32)
 def get_language_name(language_code):
     """
     Returns the full language name based on the language code.
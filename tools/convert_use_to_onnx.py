@@ -0,0 +1,50 @@
+"""
+One-time conversion of the Universal Sentence Encoder SavedModel to ONNX
+so the app can serve embeddings through onnxruntime instead of the much
+slower TensorFlow CPU path. Point USE_ONNX_MODEL_PATH at the output file
+to enable it.
+
+Requires tf2onnx (pip install tf2onnx), which is only needed for this
+script, not at runtime.
+
+Usage:
+    python tools/convert_use_to_onnx.py [output_path]
+"""
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import tensorflow_hub as hub
+import tf2onnx
+from dotenv import load_dotenv  # noqa: E402  (needs sys.path set up first)
+
+# Default location for the converted model
+DEFAULT_OUTPUT = os.path.join(PROJECT_ROOT, "models", "use.onnx")
+
+
+def main():
+    """
+    Resolves the USE model from the configured TF Hub URL and writes its
+    ONNX conversion to the output path.
+    """
+    load_dotenv()
+    model_url = os.getenv("UNIVERSAL_SENTENCE_ENCODER_URL")
+    output_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_OUTPUT
+
+    print(f"Resolving USE SavedModel from {model_url}")
+    saved_model_dir = hub.resolve(model_url)
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    print("Converting to ONNX (this can take a few minutes)...")
+    tf2onnx.convert.from_saved_model(
+        saved_model_dir, output_path=output_path
+    )
+    print(f"ONNX model written to {output_path}")
+    print(f"Set USE_ONNX_MODEL_PATH={output_path} to enable it.")
+
+
+if __name__ == "__main__":
+    main()